@@ -10,13 +10,15 @@ from __future__ import annotations
 import math
 import random
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Union
 
 import chess
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
-router = APIRouter(prefix="/chess", tags=["Chess Academy"])
+router = APIRouter(prefix="/chess", tags=["Chess Academy"], default_response_class=ORJSONResponse)
 
 CHECKMATE_SCORE = 100_000
 STARTING_FEN = chess.STARTING_FEN
@@ -112,7 +114,7 @@ TABLE_LOOKUP = {
     chess.QUEEN: QUEEN_TABLE,
 }
 
-CENTER_SQUARES = {chess.D4, chess.E4, chess.D5, chess.E5}
+CENTER_SQUARES = frozenset({chess.D4, chess.E4, chess.D5, chess.E5})
 
 DIFFICULTY_SETTINGS = {
     "explorer": {"depth": 1, "max_random_moves": 0.6},
@@ -120,6 +122,8 @@ DIFFICULTY_SETTINGS = {
     "intermediate": {"depth": 2, "max_random_moves": 0.1},
     "advanced": {"depth": 3, "max_random_moves": 0.0},
 }
+# Difficulty labels that get the forgiving move picker and softer hint wording.
+GENTLE_DIFFICULTIES = frozenset({"explorer", "beginner"})
 
 COACH_TIPS = {
     "opening": [
@@ -139,6 +143,13 @@ COACH_TIPS = {
     ],
 }
 
+# Coaching phases keyed by the last full move that still belongs to the phase,
+# checked in order; anything beyond the final threshold is treated as endgame.
+COACH_PHASES: Tuple[Tuple[int, str], ...] = (
+    (10, "opening"),
+    (25, "middle"),
+)
+
 
 @dataclass
 class MoveScore:
@@ -228,6 +239,13 @@ class HintResponse(BaseModel):
     status: StatusPayload
 
 
+# Placeholder move and greeting returned with every fresh board; both are constant.
+EMPTY_MOVE = MoveInfo(
+    from_square="", to_square="", uci="", san="", promotion=None, is_capture=False, gives_check=False, is_safe=True
+)
+NEW_GAME_MESSAGE = "新的一局已经准备好啦！请选择难度，然后开始你的第一步冒险。"
+
+
 PRACTICE_PUZZLES: List[PracticePuzzle] = [
     PracticePuzzle(
         fen="8/8/8/4k3/4N3/4K3/8/8 w - - 0 1",
@@ -291,20 +309,30 @@ def _evaluate_board(board: chess.Board) -> float:
     black_material = 0
     positional_score = 0
 
-    total_minor_pieces = len(board.pieces(chess.BISHOP, chess.WHITE)) + len(board.pieces(chess.KNIGHT, chess.WHITE)) + len(
-        board.pieces(chess.BISHOP, chess.BLACK)
-    ) + len(board.pieces(chess.KNIGHT, chess.BLACK))
-    endgame = total_minor_pieces <= 4 and (len(board.pieces(chess.QUEEN, chess.WHITE)) + len(board.pieces(chess.QUEEN, chess.BLACK))) == 0
+    # Collect every piece set once; material, phase detection, positional tables and
+    # the bishop pair bonus below all read from these instead of re-querying the board.
+    white_sets = {piece_type: board.pieces(piece_type, chess.WHITE) for piece_type in PIECE_VALUES}
+    black_sets = {piece_type: board.pieces(piece_type, chess.BLACK) for piece_type in PIECE_VALUES}
+
+    total_minor_pieces = (
+        len(white_sets[chess.BISHOP])
+        + len(white_sets[chess.KNIGHT])
+        + len(black_sets[chess.BISHOP])
+        + len(black_sets[chess.KNIGHT])
+    )
+    endgame = total_minor_pieces <= 4 and (len(white_sets[chess.QUEEN]) + len(black_sets[chess.QUEEN])) == 0
 
     for piece_type, value in PIECE_VALUES.items():
-        white_pieces = list(board.pieces(piece_type, chess.WHITE))
-        black_pieces = list(board.pieces(piece_type, chess.BLACK))
+        white_pieces = white_sets[piece_type]
+        black_pieces = black_sets[piece_type]
         white_material += value * len(white_pieces)
         black_material += value * len(black_pieces)
+        white_piece = chess.Piece(piece_type, chess.WHITE)
+        black_piece = chess.Piece(piece_type, chess.BLACK)
         for square in white_pieces:
-            positional_score += _piece_square_value(chess.Piece(piece_type, chess.WHITE), square, endgame)
+            positional_score += _piece_square_value(white_piece, square, endgame)
         for square in black_pieces:
-            positional_score += _piece_square_value(chess.Piece(piece_type, chess.BLACK), square, endgame)
+            positional_score += _piece_square_value(black_piece, square, endgame)
 
     material_score = white_material - black_material
 
@@ -318,7 +346,7 @@ def _evaluate_board(board: chess.Board) -> float:
         else:
             center_control -= 15
 
-    mobility_bonus = 5 * len(list(board.legal_moves))
+    mobility_bonus = 5 * board.legal_moves.count()
 
     king_safety = 0
     if board.has_kingside_castling_rights(chess.WHITE) or board.has_queenside_castling_rights(chess.WHITE):
@@ -326,9 +354,7 @@ def _evaluate_board(board: chess.Board) -> float:
     if board.has_kingside_castling_rights(chess.BLACK) or board.has_queenside_castling_rights(chess.BLACK):
         king_safety -= 30
 
-    bishop_pair_bonus = 35 * (
-        int(len(board.pieces(chess.BISHOP, chess.WHITE)) >= 2) - int(len(board.pieces(chess.BISHOP, chess.BLACK)) >= 2)
-    )
+    bishop_pair_bonus = 35 * (int(len(white_sets[chess.BISHOP]) >= 2) - int(len(black_sets[chess.BISHOP]) >= 2))
 
     score_from_white_perspective = (
         material_score
@@ -353,7 +379,7 @@ def _move_order_score(board: chess.Board, move: chess.Move) -> int:
         score += 80
     if board.is_castling(move):
         score += 40
-    if chess.square_name(move.to_square) in {"d4", "e4", "d5", "e5"}:
+    if move.to_square in CENTER_SQUARES:
         score += 25
     return score
 
@@ -398,6 +424,19 @@ def _find_best_move(board: chess.Board, depth: int) -> MoveScore:
     return MoveScore(best_move, best_score)
 
 
+@lru_cache(maxsize=256)
+def _cached_best_move(fen: str, depth: int) -> Tuple[str, float]:
+    # Boards are always rebuilt from FEN without move history, so the search result
+    # depends only on (fen, depth) and repeated hint/AI requests can reuse it.
+    result = _find_best_move(chess.Board(fen), depth)
+    return result.move.uci(), result.score
+
+
+def _search_best_move(board: chess.Board, depth: int) -> MoveScore:
+    uci, score = _cached_best_move(board.fen(), depth)
+    return MoveScore(chess.Move.from_uci(uci), score)
+
+
 def _is_move_safe(board: chess.Board, move: chess.Move) -> bool:
     board.push(move)
     try:
@@ -428,6 +467,19 @@ def _serialize_move(board: chess.Board, move: chess.Move) -> MoveInfo:
 
 def _status_payload(board: chess.Board) -> StatusPayload:
     outcome = board.outcome()
+    if outcome is None:
+        # outcome() has already ruled out every terminal condition below, so an
+        # ongoing game skips re-running each check (and its legal move scans).
+        return {
+            "is_check": board.is_check(),
+            "is_checkmate": False,
+            "is_stalemate": False,
+            "is_insufficient_material": False,
+            "is_seventyfive_moves": False,
+            "is_fivefold_repetition": False,
+            "winner": None,
+            "result": None,
+        }
     status = {
         "is_check": board.is_check(),
         "is_checkmate": board.is_checkmate(),
@@ -435,35 +487,31 @@ def _status_payload(board: chess.Board) -> StatusPayload:
         "is_insufficient_material": board.is_insufficient_material(),
         "is_seventyfive_moves": board.is_seventyfive_moves(),
         "is_fivefold_repetition": board.is_fivefold_repetition(),
-        "winner": None,
-        "result": None,
     }
-    if outcome:
-        status["winner"] = "white" if outcome.winner == chess.WHITE else "black" if outcome.winner == chess.BLACK else "draw"
-        status["result"] = outcome.result()
+    status["winner"] = "white" if outcome.winner == chess.WHITE else "black" if outcome.winner == chess.BLACK else "draw"
+    status["result"] = outcome.result()
     return status
 
 
 def _coach_message(board: chess.Board) -> str:
     total_moves = board.fullmove_number
-    if total_moves <= 10:
-        return random.choice(COACH_TIPS["opening"])
-    if total_moves <= 25:
-        return random.choice(COACH_TIPS["middle"])
-    return random.choice(COACH_TIPS["endgame"])
+    phase = next((name for limit, name in COACH_PHASES if total_moves <= limit), "endgame")
+    return random.choice(COACH_TIPS[phase])
 
 
+@lru_cache(maxsize=64)
 def _difficulty_from_label(label: str) -> Tuple[str, Dict[str, float]]:
     canonical = label.lower().strip()
-    if canonical not in DIFFICULTY_SETTINGS:
+    settings = DIFFICULTY_SETTINGS.get(canonical)
+    if settings is None:
         raise HTTPException(status_code=400, detail=f"Unknown difficulty '{label}'. Choose from {', '.join(DIFFICULTY_SETTINGS)}")
-    return canonical, DIFFICULTY_SETTINGS[canonical]
+    return canonical, settings
 
 
 def _choose_beginner_move(board: chess.Board, randomness: float) -> MoveScore:
     moves = list(board.legal_moves)
     random.shuffle(moves)
-    safe_moves: List[chess.Move] = []
+    safe_moves: List[Tuple[chess.Move, float]] = []
     smart_moves: List[Tuple[chess.Move, float]] = []
     for move in moves:
         safety = _is_move_safe(board, move)
@@ -471,16 +519,14 @@ def _choose_beginner_move(board: chess.Board, randomness: float) -> MoveScore:
         score = -_evaluate_board(board)
         board.pop()
         if safety:
-            safe_moves.append(move)
+            safe_moves.append((move, score))
             smart_moves.append((move, score))
         else:
             smart_moves.append((move, score - 150))
 
     if safe_moves and random.random() > randomness:
-        best_safe = max(safe_moves, key=lambda mv: _move_order_score(board, mv))
-        board.push(best_safe)
-        score = -_evaluate_board(board)
-        board.pop()
+        # Scores were collected in the loop above, so the chosen move is not re-evaluated.
+        best_safe, score = max(safe_moves, key=lambda item: _move_order_score(board, item[0]))
         return MoveScore(best_safe, score)
 
     # Fallback to the highest scoring move according to our evaluation.
@@ -491,18 +537,15 @@ def _choose_beginner_move(board: chess.Board, randomness: float) -> MoveScore:
 @router.get("/new-game", response_model=MoveOutcome)
 def start_new_game() -> MoveOutcome:
     board = chess.Board()
-    first_move = MoveInfo(
-        from_square="", to_square="", uci="", san="", promotion=None, is_capture=False, gives_check=False, is_safe=True
-    )
     return MoveOutcome(
         fen=board.fen(),
         turn="white",
-        move=first_move,
+        move=EMPTY_MOVE,
         halfmove_clock=board.halfmove_clock,
         fullmove_number=board.fullmove_number,
         status=_status_payload(board),
         evaluation=_evaluate_board(board),
-        message="新的一局已经准备好啦！请选择难度，然后开始你的第一步冒险。",
+        message=NEW_GAME_MESSAGE,
     )
 
 
@@ -513,9 +556,10 @@ def legal_moves(payload: LegalMovesRequest) -> MoveCollection:
         raise HTTPException(status_code=400, detail="Game is already over. Start a new game to continue playing.")
 
     square = chess.parse_square(payload.square)
-    if board.piece_at(square) is None:
+    piece = board.piece_at(square)
+    if piece is None:
         raise HTTPException(status_code=404, detail="There is no piece on the selected square.")
-    if board.piece_at(square).color != board.turn:
+    if piece.color != board.turn:
         raise HTTPException(status_code=400, detail="It's not that piece's turn to move.")
 
     moves = [mv for mv in board.legal_moves if mv.from_square == square]
@@ -574,13 +618,13 @@ def ai_move(payload: AIMoveRequest) -> AIMoveResponse:
         raise HTTPException(status_code=400, detail="Game is already finished. No moves available.")
 
     label, settings = _difficulty_from_label(payload.difficulty)
-    randomness = settings.get("max_random_moves", 0.0)
-    depth = settings.get("depth", 1)
+    randomness = settings["max_random_moves"]
+    depth = settings["depth"]
 
-    if label in {"explorer", "beginner"} and random.random() < randomness:
+    if label in GENTLE_DIFFICULTIES and random.random() < randomness:
         choice = _choose_beginner_move(board, randomness)
     else:
-        choice = _find_best_move(board, depth)
+        choice = _search_best_move(board, depth)
 
     move_info = _serialize_move(board, choice.move)
     board.push(choice.move)
@@ -611,15 +655,15 @@ def hint(payload: HintRequest) -> HintResponse:
 
     difficulty_label = payload.difficulty or ("advanced" if board.fullmove_number > 20 else "intermediate")
     label, settings = _difficulty_from_label(difficulty_label)
-    depth = max(1, settings.get("depth", 1))
+    depth = max(1, settings["depth"])
 
-    suggestion = _find_best_move(board, depth)
+    suggestion = _search_best_move(board, depth)
     move_info = _serialize_move(board, suggestion.move)
     status = _status_payload(board)
     evaluation = suggestion.score
     guidance = (
         "这个走法可以守住你的国王并准备反击，试试看！"
-        if label in {"explorer", "beginner"}
+        if label in GENTLE_DIFFICULTIES
         else "这是当前最聪明的计划，可以帮助你获得更好的局面。"
     )
     return HintResponse(
@@ -1,8 +1,10 @@
 # Path: backend/features/core_api/router.py
+import asyncio
 import os
 import sys
 import json
-import requests
+import httpx
+import orjson
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field
@@ -55,10 +57,44 @@ class PlaceholderResponse(BaseModel):
     message: str
     summary: Optional[Dict[str, Any]] = None
 
+# --- Shared HTTP client for outbound AI calls ---
+# A single pooled async client keeps connections to the Gemini host alive and lets
+# /ai-proxy await the call instead of blocking the event loop on a sync request.
+_GEMINI_CLIENT = httpx.AsyncClient(
+    timeout=180,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+)
+# Caps how many Gemini calls this process keeps in flight so a burst of /ai-proxy
+# traffic queues here instead of exhausting the provider quota or the pool above.
+_GEMINI_CONCURRENCY = asyncio.Semaphore(int(os.environ.get("GEMINI_MAX_CONCURRENCY", "16")))
+
+# --- Gemini request constants ---
+# Everything except the model name, API key and content parts is identical for every
+# call, so it is defined once here instead of being rebuilt per request.
+_GEMINI_URL_TEMPLATE = "https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
+_GEMINI_JSON_HEADERS = {"Content-Type": "application/json"}
+_GEMINI_GENERATION_CONFIG = {"temperature": 0.7, "topK": 1, "topP": 1, "maxOutputTokens": 20000}
+_GEMINI_SAFETY_SETTINGS = [
+    {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"}
+]
+# Pre-serialized `"generationConfig":...,"safetySettings":...}` tail of the request body;
+# only the `contents` field changes between calls and is encoded per request.
+_GEMINI_BODY_TAIL = orjson.dumps(
+    {"generationConfig": _GEMINI_GENERATION_CONFIG, "safetySettings": _GEMINI_SAFETY_SETTINGS}
+)[1:]
+
+
+def _gemini_request_body(parts: List[Dict[str, Any]]) -> bytes:
+    """Builds the JSON request body, splicing the encoded contents onto the constant tail."""
+    return b'{"contents":' + orjson.dumps([{"parts": parts}]) + b"," + _GEMINI_BODY_TAIL
+
 # --- Helper Function for Gemini API call ---
-def _call_gemini_api(api_key: str, model: str, prompt: str, image: Optional[str], images: Optional[List[str]], system: Optional[str], audio_b64: Optional[str]) -> Dict[str, Any]:
+async def _call_gemini_api(api_key: str, model: str, prompt: str, image: Optional[str], images: Optional[List[str]], system: Optional[str], audio_b64: Optional[str]) -> Dict[str, Any]:
     """Helper function to call the Google Gemini API."""
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}"
+    url = _GEMINI_URL_TEMPLATE.format(model=model)
     parts = []
     
     if system:
@@ -76,22 +112,15 @@ def _call_gemini_api(api_key: str, model: str, prompt: str, image: Optional[str]
     if audio_b64:
         parts.append({"inline_data": {"mime_type": "audio/wav", "data": audio_b64}})
 
-    request_body = {
-        "contents": [{"parts": parts}],
-        "generationConfig": {"temperature": 0.7, "topK": 1, "topP": 1, "maxOutputTokens": 20000},
-        "safetySettings": [
-            {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
-            {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
-            {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
-            {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"}
-        ]
-    }
-    
-    response = requests.post(url, json=request_body)
+    # Inline images make these bodies large, so encode/decode them with orjson.
+    async with _GEMINI_CONCURRENCY:
+        response = await _GEMINI_CLIENT.post(
+            url, params={"key": api_key}, content=_gemini_request_body(parts), headers=_GEMINI_JSON_HEADERS
+        )
     if response.status_code != 200:
         raise HTTPException(status_code=response.status_code, detail=f"Gemini API error: {response.text}")
     
-    result = response.json()
+    result = orjson.loads(response.content)
     usage_metadata = result.get('usageMetadata', {})
     input_tokens = usage_metadata.get('promptTokenCount', 0)
     output_tokens = usage_metadata.get('candidatesTokenCount', 0)
@@ -131,7 +160,7 @@ async def ai_proxy(data: AIProxyRequest):
         )
 
     if data.provider == 'gemini':
-        return _call_gemini_api(
+        return await _call_gemini_api(
             api_key=api_key, model=data.model, prompt=data.prompt,
             image=data.image, images=data.images, system=data.system, audio_b64=data.audio
         )
@@ -8,9 +8,15 @@ import secrets
 from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse, Response
+import orjson
 from pydantic import BaseModel, ConfigDict, Field
 
-router = APIRouter(prefix="/ielts-vocab", tags=["IELTS Vocabulary Lab"])
+router = APIRouter(
+    prefix="/ielts-vocab",
+    tags=["IELTS Vocabulary Lab"],
+    default_response_class=ORJSONResponse,
+)
 
 
 class GenerateRoundRequest(BaseModel):
@@ -20,7 +26,7 @@ class GenerateRoundRequest(BaseModel):
     mode: Optional[str] = None
     previous_outcome: Optional[str] = Field(default=None, alias="previousOutcome")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class VerifyRoundRequest(BaseModel):
@@ -30,7 +36,7 @@ class VerifyRoundRequest(BaseModel):
     answer_payload: str = Field(alias="answerPayload")
     selected_option_id: Optional[str] = Field(default=None, alias="selectedOptionId")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 DIFFICULTY_PROFILES: Dict[str, Dict[str, Any]] = {
@@ -462,6 +468,52 @@ IELTS_VOCABULARY: List[Dict[str, Any]] = [
 ]
 
 
+# Vocabulary entries grouped by difficulty, so round generation does not re-filter
+# the full list on every request.
+WORD_POOLS: Dict[str, List[Dict[str, Any]]] = {
+    difficulty: [entry for entry in IELTS_VOCABULARY if entry["difficulty"] == difficulty]
+    for difficulty in DIFFICULTY_PROFILES
+}
+
+# Distractor candidates for each word, computed once so that building a question
+# samples from a ready-made list instead of re-filtering the whole vocabulary.
+DISTRACTOR_POOLS: Dict[str, List[Dict[str, Any]]] = {
+    entry["word"]: [other for other in IELTS_VOCABULARY if other["word"] != entry["word"]]
+    for entry in IELTS_VOCABULARY
+}
+
+# De-duplicated synonyms drawn from every other word, used as synonym-question
+# distractors.  Built once instead of re-walking the vocabulary per question.
+SYNONYM_DISTRACTOR_POOLS: Dict[str, List[str]] = {
+    entry["word"]: list(
+        dict.fromkeys(
+            synonym
+            for other in IELTS_VOCABULARY
+            if other["word"] != entry["word"]
+            for synonym in other.get("synonyms", [])
+        )
+    )
+    for entry in IELTS_VOCABULARY
+}
+
+# Word-specific part of every round's answer payload.  Only the round/option ids,
+# mode and skill focus vary per round, so the rest is projected once per word.
+ANSWER_DETAILS: Dict[str, Dict[str, Any]] = {
+    entry["word"]: {
+        "word": entry["word"],
+        "phonetic": entry.get("phonetic"),
+        "translation": entry.get("translation"),
+        "definition": entry["definition"],
+        "synonyms": entry.get("synonyms", []),
+        "example": entry.get("example"),
+        "usage_tip": entry.get("usage_tip"),
+        "collocations": entry.get("collocations", []),
+        "difficulty": entry["difficulty"],
+    }
+    for entry in IELTS_VOCABULARY
+}
+
+
 def _encode_payload(payload: Dict[str, Any]) -> str:
     raw = json.dumps(payload, ensure_ascii=False).encode("utf-8")
     return base64.urlsafe_b64encode(raw).decode("utf-8")
@@ -476,14 +528,14 @@ def _decode_payload(payload: str) -> Dict[str, Any]:
 
 
 def _word_pool_for_difficulty(difficulty: str) -> List[Dict[str, Any]]:
-    pool = [entry for entry in IELTS_VOCABULARY if entry["difficulty"] == difficulty]
+    pool = WORD_POOLS.get(difficulty, [])
     if len(pool) < 4:
         raise HTTPException(status_code=500, detail="Not enough vocabulary items configured")
     return pool
 
 
 def _pick_distractor_words(target_word: Dict[str, Any], count: int) -> List[Dict[str, Any]]:
-    pool = [entry for entry in IELTS_VOCABULARY if entry["word"] != target_word["word"]]
+    pool = DISTRACTOR_POOLS[target_word["word"]]
     if len(pool) < count:
         raise HTTPException(status_code=500, detail="Insufficient distractor words configured")
     return random.sample(pool, count)
@@ -493,21 +545,21 @@ def _new_option_id() -> str:
     return f"opt-{secrets.token_hex(3)}"
 
 
+def _shuffled_options(entries: List[Tuple[str, str]], correct_key: str) -> Tuple[List[Dict[str, Any]], str]:
+    """Shuffle ``(key, label)`` pairs into option payloads and return the correct option id."""
+
+    random.shuffle(entries)
+    options = [{"id": _new_option_id(), "label": label} for _, label in entries]
+    correct_index = next(index for index, (key, _) in enumerate(entries) if key == correct_key)
+    return options, options[correct_index]["id"]
+
+
 def _build_definition_question(target: Dict[str, Any]) -> Dict[str, Any]:
     distractors = _pick_distractor_words(target, 3)
-    option_bank: List[Tuple[str, str]] = []
-    option_bank.append((target["word"], target["definition"]))
-    for item in distractors:
-        option_bank.append((item["word"], item["definition"]))
-    random.shuffle(option_bank)
-
-    options: List[Dict[str, Any]] = []
-    correct_option_id: Optional[str] = None
-    for word, definition in option_bank:
-        option_id = _new_option_id()
-        if word == target["word"]:
-            correct_option_id = option_id
-        options.append({"id": option_id, "label": definition})
+    options, correct_option_id = _shuffled_options(
+        [(item["word"], item["definition"]) for item in (target, *distractors)],
+        target["word"],
+    )
 
     return {
         "question_type": "definition",
@@ -532,30 +584,21 @@ def _build_synonym_question(target: Dict[str, Any]) -> Dict[str, Any]:
         return _build_definition_question(target)
 
     correct_synonym = random.choice(synonyms)
-    distractor_pool: List[str] = []
-    for entry in IELTS_VOCABULARY:
-        if entry["word"] == target["word"]:
-            continue
-        distractor_pool.extend(entry.get("synonyms", []))
+    correct_key = correct_synonym.lower()
     distractor_candidates = [
         item
-        for item in dict.fromkeys(distractor_pool)
-        if item.lower() != correct_synonym.lower()
+        for item in SYNONYM_DISTRACTOR_POOLS[target["word"]]
+        if item.lower() != correct_key
     ]
     if len(distractor_candidates) < 3:
         distractor_candidates.extend([entry["word"] for entry in _pick_distractor_words(target, 3)])
     random.shuffle(distractor_candidates)
     distractors = distractor_candidates[:3]
 
-    options: List[Dict[str, Any]] = []
-    correct_option_id: Optional[str] = None
-    ordered_options = [correct_synonym, *distractors]
-    random.shuffle(ordered_options)
-    for synonym in ordered_options:
-        option_id = _new_option_id()
-        if synonym == correct_synonym:
-            correct_option_id = option_id
-        options.append({"id": option_id, "label": synonym})
+    options, correct_option_id = _shuffled_options(
+        [(synonym, synonym) for synonym in (correct_synonym, *distractors)],
+        correct_synonym,
+    )
 
     return {
         "question_type": "synonym",
@@ -581,16 +624,10 @@ def _build_usage_question(target: Dict[str, Any]) -> Dict[str, Any]:
         placeholder_sentence = f"_____: {sentence}"
 
     distractors = _pick_distractor_words(target, 3)
-    options: List[Dict[str, Any]] = []
-    correct_option_id: Optional[str] = None
-    word_options = [target["word"], *[item["word"] for item in distractors]]
-    random.shuffle(word_options)
-
-    for word in word_options:
-        option_id = _new_option_id()
-        if word == target["word"]:
-            correct_option_id = option_id
-        options.append({"id": option_id, "label": word})
+    options, correct_option_id = _shuffled_options(
+        [(item["word"], item["word"]) for item in (target, *distractors)],
+        target["word"],
+    )
 
     return {
         "question_type": "usage",
@@ -614,12 +651,13 @@ QUESTION_BUILDERS = {
     "synonym": _build_synonym_question,
     "usage": _build_usage_question,
 }
+QUESTION_MODES: Tuple[str, ...] = tuple(QUESTION_BUILDERS)
 
 
 def _ensure_mode(mode: Optional[str]) -> str:
     if mode and mode in QUESTION_BUILDERS:
         return mode
-    return random.choice(list(QUESTION_BUILDERS.keys()))
+    return random.choice(QUESTION_MODES)
 
 
 def _difficulty_meta(difficulty: str) -> Dict[str, Any]:
@@ -629,48 +667,55 @@ def _difficulty_meta(difficulty: str) -> Dict[str, Any]:
         raise HTTPException(status_code=400, detail="Unsupported difficulty level") from exc
 
 
+# The game configuration is fully static, so it is assembled once at import
+# time and the same payload is served on every request.
+GAME_CONFIG_PAYLOAD: Dict[str, Any] = {
+    "success": True,
+    "difficulties": [
+        {
+            "id": key,
+            "label": value["label"],
+            "band": value["band"],
+            "description": value["description"],
+            "skills": value["skills"],
+            "countdown": value["countdown"],
+            "score": value["score"],
+            "defaultSession": value["default_session"],
+            "palette": value.get("palette", {}),
+        }
+        for key, value in DIFFICULTY_PROFILES.items()
+    ],
+    "modes": [
+        {
+            "id": key,
+            "label": value["label"],
+            "description": value["description"],
+            "skillFocus": value["skill_focus"],
+            "samplePrompt": value["sample_prompt"],
+        }
+        for key, value in GAME_MODES.items()
+    ],
+    "sessionLengths": [5, 6, 8, 12, 15],
+    "defaultDifficulty": "foundation",
+    "defaultMode": "definition",
+    "focusNotes": {
+        diff: {
+            "mantras": meta["mantras"],
+            "strategy": meta["skills"][0] if meta["skills"] else "精准理解",
+        }
+        for diff, meta in DIFFICULTY_PROFILES.items()
+    },
+    "wordInventory": len(IELTS_VOCABULARY),
+}
+GAME_CONFIG_BODY = orjson.dumps(GAME_CONFIG_PAYLOAD)
+
+
 @router.get("/game-config")
-def read_game_config() -> Dict[str, Any]:
+def read_game_config() -> Response:
     """Return static configuration for the IELTS vocabulary module."""
 
-    return {
-        "success": True,
-        "difficulties": [
-            {
-                "id": key,
-                "label": value["label"],
-                "band": value["band"],
-                "description": value["description"],
-                "skills": value["skills"],
-                "countdown": value["countdown"],
-                "score": value["score"],
-                "defaultSession": value["default_session"],
-                "palette": value.get("palette", {}),
-            }
-            for key, value in DIFFICULTY_PROFILES.items()
-        ],
-        "modes": [
-            {
-                "id": key,
-                "label": value["label"],
-                "description": value["description"],
-                "skillFocus": value["skill_focus"],
-                "samplePrompt": value["sample_prompt"],
-            }
-            for key, value in GAME_MODES.items()
-        ],
-        "sessionLengths": [5, 6, 8, 12, 15],
-        "defaultDifficulty": "foundation",
-        "defaultMode": "definition",
-        "focusNotes": {
-            diff: {
-                "mantras": meta["mantras"],
-                "strategy": meta["skills"][0] if meta["skills"] else "精准理解",
-            }
-            for diff, meta in DIFFICULTY_PROFILES.items()
-        },
-        "wordInventory": len(IELTS_VOCABULARY),
-    }
+    # Serialized once at import; skips response validation and JSON encoding per request.
+    return Response(content=GAME_CONFIG_BODY, media_type="application/json")
 
 
 @router.post("/generate-round")
@@ -694,19 +739,13 @@ def generate_round(payload: GenerateRoundRequest) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail="Question generation failed")
 
     meta = _difficulty_meta(difficulty)
+    # The pool only holds words of the requested difficulty, so the prebuilt
+    # details already carry the right "difficulty" value.
     answer_payload = _encode_payload(
         {
             "round_id": round_id,
             "correct_option_id": correct_option_id,
-            "word": target["word"],
-            "phonetic": target.get("phonetic"),
-            "translation": target.get("translation"),
-            "definition": target["definition"],
-            "synonyms": target.get("synonyms", []),
-            "example": target.get("example"),
-            "usage_tip": target.get("usage_tip"),
-            "collocations": target.get("collocations", []),
-            "difficulty": difficulty,
+            **ANSWER_DETAILS[target["word"]],
             "mode": mode,
             "skill_focus": question.get("skill_focus"),
         }
@@ -760,13 +799,7 @@ def verify_answer(payload: VerifyRoundRequest) -> Dict[str, Any]:
         is_correct = selected_option_id == correct_option_id
         outcome = "correct" if is_correct else "incorrect"
 
-    score_scheme = meta["score"]
-    if outcome == "correct":
-        score_delta = score_scheme["correct"]
-    elif outcome == "timeout":
-        score_delta = score_scheme["timeout"]
-    else:
-        score_delta = score_scheme["incorrect"]
+    score_delta = meta["score"][outcome]
 
     detail = {
         "word": answer_data.get("word"),
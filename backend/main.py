@@ -2,6 +2,7 @@
 import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 # [关键修复] 再次确认已移除所有手动修改 sys.path 的代码。
 # 这是保证在标准化容器环境中稳定启动的第一步。
@@ -30,7 +31,9 @@ from features.firecrawl_exporter.router import router as firecrawl_exporter_rout
 app = FastAPI(
     title="flashmvp Backend API (Modular)",
     description="A modular API for the flashmvp project, running on Google Cloud Run.",
-    version="2.4.0" # Bump version for new feature
+    version="2.4.0", # Bump version for new feature
+    # orjson 编码所有路由的 JSON 响应 (包括未单独指定 response_class 的模块)。
+    default_response_class=ORJSONResponse,
 )
 
 # --- CORS 中间件配置 ---